@@ -9,8 +9,7 @@ import click
 from google.cloud import storage
 
 TODAY = datetime.now(tz=timezone.utc)
-CLIENT = storage.Client()
-BUCKET = CLIENT.get_bucket('cpg-seqr-main')
+SEQR_BUCKET = 'cpg-seqr-main'
 
 GENOME_PREFIX = 'seqr_loader/'
 EXOME_PREFIX = 'exome/seqr_loader/'
@@ -22,7 +21,11 @@ def get_seqr_loads(bucket, prefix: str):  # noqa: ANN001
 
     seqr_load_directories = set()
     seqr_loads = {}
-    for blob in bucket.list_blobs(prefix=prefix):
+    # only the name and creation time are used, so only request those fields
+    for blob in bucket.list_blobs(
+        prefix=prefix,
+        fields='items(name,timeCreated),nextPageToken',
+    ):
         if '.mt' in blob.name or '.ht' in blob.name:
             continue
 
@@ -70,7 +73,7 @@ def delete_seqr_load_files(seqr_loads_to_delete: list[str]):
     """Takes a list of seqr_loader folders and deletes them entirely"""
 
     seqr_loads_to_delete = [
-        f'gs://cpg-seqr-main/{load}' for load in seqr_loads_to_delete
+        f'gs://{SEQR_BUCKET}/{load}' for load in seqr_loads_to_delete
     ]
     subprocess.run(
         [  # noqa: S603, S607
@@ -90,9 +93,12 @@ def delete_seqr_load_files(seqr_loads_to_delete: list[str]):
 def main(dry_run: bool):
     """Run the seqr_load analyser and deleter for genomes and exomes"""
 
+    # only connect to GCS once the CLI arguments have been parsed
+    bucket = storage.Client().bucket(SEQR_BUCKET)
+
     logging.info('GENOME')
     genome_loads, extra_genome_folders = get_seqr_loads(
-        bucket=BUCKET,
+        bucket=bucket,
         prefix=GENOME_PREFIX,
     )
 
@@ -106,7 +112,7 @@ def main(dry_run: bool):
 
     logging.info('EXOME')
     exome_loads, extra_exome_folders = get_seqr_loads(
-        bucket=BUCKET,
+        bucket=bucket,
         prefix=EXOME_PREFIX,
     )
 
@@ -167,9 +167,7 @@ def write_outputs(
     with open(f'{output_path}/hpo_terms.tsv', 'w', encoding='utf-8') as f:
         writer = csv.writer(f, delimiter='\t')
         for individual, hpo_terms in individual_hpo_terms.items():
-            row = [individual, *list(hpo_terms)]
-            if row:
-                writer.writerow(row)
+            writer.writerow([individual, *hpo_terms])
     logging.info(f'Wrote HPO terms tsv to {output_path}.')
 
     # HPO terms json
@@ -191,8 +189,7 @@ def write_outputs(
             ],
         )
         for ped_row in pedigrees:
-            values = list(ped_row.values())
-            writer.writerow(values)
+            writer.writerow(ped_row.values())
     logging.info(f'Wrote pedigree to {output_path}.')
 
     # Sample map
@@ -49,7 +49,18 @@ def main(
         manifest = manifest_file.read()
 
     storage_client = storage.Client()
-    bucket = storage_client.get_bucket(upload_bucket_name)
+    bucket = storage_client.bucket(upload_bucket_name)
+
+    # collect all checksums under the prefix in one paginated listing,
+    # rather than a separate request per file in the manifest
+    # only the name and checksum are requested for each blob
+    blob_md5s = {
+        blob.name: blob.md5_hash
+        for blob in bucket.list_blobs(
+            prefix=os.path.join(file_prefix, ''),
+            fields='items(name,md5Hash),nextPageToken',
+        )
+    }
 
     any_errors = False
     tsv_reader = csv.DictReader(manifest.splitlines(), delimiter=delimiter)
@@ -59,14 +70,19 @@ def main(
         filename = row[filename_column]
         expected_md5 = row[checksum_column]
         # empty file_prefix gets skipped
-        check_blob = bucket.get_blob(os.path.join(file_prefix, filename))
-        if not check_blob:
+        blob_name = os.path.join(file_prefix, filename)
+        if blob_name not in blob_md5s:
             logging.error(f'blob does not exist: {filename}')
             any_errors = True
             continue
+        # composite objects, e.g. from parallel uploads, have no MD5 checksum
+        if blob_md5s[blob_name] is None:
+            logging.error(f'blob has no MD5 checksum: {filename}')
+            any_errors = True
+            continue
         # Read the checksum from the blob. The checksum is base64-encoded.
         actual_md5 = binascii.hexlify(
-            base64.urlsafe_b64decode(check_blob.md5_hash),
+            base64.urlsafe_b64decode(blob_md5s[blob_name]),
         ).decode('utf-8')
 
         if expected_md5 == actual_md5:
@@ -6,6 +6,7 @@ Transfer datasets from presigned URLs to a dataset's GCP main-upload bucket.
 
 import os
 from shlex import quote
+from urllib.parse import urlsplit
 
 import click
 import hailtop.batch as hb
@@ -34,7 +35,7 @@ def main(presigned_url_file_path: str):
     assert all({billing_project, cpg_driver_image, dataset, output_prefix})
 
     with AnyPath(presigned_url_file_path).open() as file:
-        presigned_urls = [line.strip() for line in file.readlines() if line.strip()]
+        presigned_urls = [stripped for line in file if (stripped := line.strip())]
 
     incorrect_urls = [url for url in presigned_urls if not url.startswith('https://')]
     if incorrect_urls:
@@ -51,7 +52,7 @@ def main(presigned_url_file_path: str):
     # may as well batch them to reduce the number of VMs
     for idx, url in enumerate(presigned_urls):
 
-        filename = os.path.basename(url).split('?')[0]
+        filename = os.path.basename(urlsplit(url).path)
         j = batch.new_job(f'URL {idx} ({filename})')
         quoted_url = quote(url)
         authenticate_cloud_credentials_in_job(job=j)
@@ -33,7 +33,7 @@ def main(owncloud_curl_file_path: str):
     assert all({billing_project, cpg_driver_image, dataset, output_prefix})
 
     with AnyPath(owncloud_curl_file_path).open() as file:
-        owncloud_curls = [line.strip() for line in file.readlines() if line.strip()]
+        owncloud_curls = [stripped for line in file if (stripped := line.strip())]
 
     incorrect_urls = [url for url in owncloud_curls if not url.startswith('\'https://')]
     if incorrect_urls:
@@ -90,7 +90,14 @@ def main(
     sample_results = list(to_path(comparison_folder).glob(f'{cpg_id}*'))
 
     # pick out the summary file
-    summary_file = [file for file in sample_results if 'extended.csv' in file.name][0]
+    summary_file = next(
+        (file for file in sample_results if 'extended.csv' in file.name),
+        None,
+    )
+    if summary_file is None:
+        raise Exception(
+            f'No hap.py extended.csv results for {cpg_id} in {comparison_folder}',
+        )
 
     # populate a dictionary of results for this sample
     summary_data = {
@@ -20,6 +20,7 @@ Results:
 import logging
 import os
 from argparse import ArgumentParser
+from functools import lru_cache
 from pathlib import Path
 
 import hail as hl
@@ -44,15 +45,84 @@ from sample_metadata.apis import AnalysisApi, ParticipantApi
 from sample_metadata.model.analysis_query_model import AnalysisQueryModel
 from sample_metadata.model.analysis_type import AnalysisType
 
-MT_TO_VCF_SCRIPT = os.path.join(os.path.dirname(__file__), 'mt_to_vcf.py')
-RESULTS_SCRIPT = os.path.join(os.path.dirname(__file__), 'parse_validation_results.py')
+SCRIPT_DIR = os.path.dirname(__file__)
+MT_TO_VCF_SCRIPT = os.path.join(SCRIPT_DIR, 'mt_to_vcf.py')
+RESULTS_SCRIPT = os.path.join(SCRIPT_DIR, 'parse_validation_results.py')
 REF_SDF = 'gs://cpg-validation-test/refgenome_sdf'
+HAPPY_CPU = 4
+REF_GENOME = (
+    'gs://cpg-common-main/references/hg38/v0/dragen_reference/'
+    'Homo_sapiens_assembly38_masked.fasta'
+)
 
 # create a logger
 logger = logging.getLogger(__file__)
 logger.setLevel(level=logging.INFO)
 
 
+@lru_cache(maxsize=1)
+def get_git_details() -> dict[str, str]:
+    """
+    each lookup shells out to git, and the answer is fixed for this run
+    so find these once, and reuse for every job which needs the repo
+
+    Returns
+    -------
+    dict of prepare_git_job keyword arguments
+    """
+    return {
+        'organisation': get_organisation_name_from_current_directory(),
+        'repo_name': get_repo_name_from_current_directory(),
+        'commit': get_git_commit_ref_of_current_repository(),
+    }
+
+
+@lru_cache(maxsize=1)
+def get_sdf_files() -> dict[str, str]:
+    """
+    the reference SDF is a folder, read into each comparison job as a group
+    the folder content doesn't change, so list it once for all samples
+
+    Returns
+    -------
+    dict of {file name: full path} for each file in the SDF
+    """
+    return {file.name: file.as_uri() for file in AnyPath(REF_SDF).glob('*')}
+
+
+@lru_cache(maxsize=1)
+def get_stratification_files(stratification: str) -> dict[str, str]:
+    """
+    checks the stratification folder and finds all the region files within
+    shared by all samples, so this is only checked & listed once per run
+
+    Parameters
+    ----------
+    stratification : path to stratification BED data
+
+    Returns
+    -------
+    dict of {file name: full path}, including the definition.tsv
+    """
+    strat_folder = to_path(stratification)
+    assert (
+        strat_folder.exists()
+    ), f'{stratification} does not exist, or was not accessible'
+
+    definitions = strat_folder / 'definition.tsv'
+    assert (
+        definitions.exists()
+    ), f'the region file {str(definitions)} does not exist'
+
+    strat_bed_files = list(strat_folder.glob('*.bed*'))
+    assert len(strat_bed_files) > 0, 'No bed files in the stratified BED folder'
+
+    # create a dictionary to pass to input generation
+    strat_dict = {'definition.tsv': str(definitions)}
+    strat_dict.update({file.name: str(file) for file in strat_bed_files})
+    return strat_dict
+
+
 def mt_to_vcf(
     input_mt: str,
     samples: set[str],
@@ -77,16 +147,18 @@ def mt_to_vcf(
     logging.info(f'Extracting {" ".join(samples_in_jc)} from the joint-call')
     sample_jobs = {}
 
+    # find all previously extracted VCFs in a single listing
+    # rather than checking for each sample's VCF separately
+    vcf_folder = os.path.join(output_root, 'single_sample_vcfs')
+    existing_vcfs = {file.name for file in AnyPath(vcf_folder).glob('*.vcf.bgz')}
+
     # extract all common samples into a separate file
     for sample in samples_in_jc:
 
-        sample_path = os.path.join(
-            output_root,
-            'single_sample_vcfs',
-            f'{sample}.vcf.bgz',
-        )
+        sample_vcf = f'{sample}.vcf.bgz'
+        sample_path = os.path.join(vcf_folder, sample_vcf)
 
-        if AnyPath(sample_path).exists():
+        if sample_vcf in existing_vcfs:
             sample_jobs[sample] = (sample_path, None)
             logging.info(f'No action taken, {sample_path} already exists')
             continue
@@ -94,12 +166,7 @@ def mt_to_vcf(
         job = get_batch().new_job(f'Extract {sample} from VCF')
         job.image(get_config()['workflow']['driver_image'])
         authenticate_cloud_credentials_in_job(job)
-        prepare_git_job(
-            job=job,
-            organisation=get_organisation_name_from_current_directory(),
-            repo_name=get_repo_name_from_current_directory(),
-            commit=get_git_commit_ref_of_current_repository(),
-        )
+        prepare_git_job(job=job, **get_git_details())
 
         job.command(
             f'PYTHONPATH=$(pwd) python3 {MT_TO_VCF_SCRIPT} '
@@ -142,26 +209,20 @@ def comparison_job(
     job.image(get_config()['image']['happy'])
     job.memory('100Gi')
     job.storage('100Gi')
-    job.cpu(4)
+    job.cpu(HAPPY_CPU)
     vcf_input = batch.read_input_group(vcf=ss_vcf, index=f'{ss_vcf}.tbi')
     truth_input = batch.read_input_group(
         vcf=truth_vcf,
         index=f'{truth_vcf}.tbi',
     )
     truth_bed = batch.read_input(truth_bed)
-    refgenome = (
-        'gs://cpg-common-main/references/hg38/v0/dragen_reference/'
-        'Homo_sapiens_assembly38_masked.fasta'
-    )
     batch_ref = batch.read_input_group(
-        fasta=refgenome,
-        index=f'{refgenome}.fai',
+        fasta=REF_GENOME,
+        index=f'{REF_GENOME}.fai',
     )
 
     # sdf loading as a Glob operation
-    sdf = batch.read_input_group(
-        **{file.name: file.as_uri() for file in AnyPath(REF_SDF).glob('*')},
-    )
+    sdf = batch.read_input_group(**get_sdf_files())
 
     # hap.py outputs:
     # output.extended.csv
@@ -188,30 +249,16 @@ def comparison_job(
         f'hap.py {truth_input["vcf"]} {vcf_input["vcf"]} '
         f'-r {batch_ref["fasta"]} -R {truth_bed} '
         f'-o {job.output}/output --leftshift '
-        f'--threads 4 --preprocess-truth '
+        f'--threads {HAPPY_CPU} --preprocess-truth '
         f'--engine-vcfeval-path=/opt/hap.py/libexec/rtg-tools-install/rtg '
         f'--engine-vcfeval-template {sdf} --engine=vcfeval '
     )
 
     # allow for stratification
     if stratification:
-        strat_folder = to_path(stratification)
-        assert (
-            strat_folder.exists()
-        ), f'{stratification} does not exist, or was not accessible'
-
-        definitions = strat_folder / 'definition.tsv'
-        assert (
-            definitions.exists()
-        ), f'the region file {str(definitions)} does not exist'
-
-        strat_bed_files = list(strat_folder.glob('*.bed*'))
-        assert len(strat_bed_files) > 0, 'No bed files in the stratified BED folder'
-
-        # create a dictionary to pass to input generation
-        strat_dict = {'definition.tsv': str(definitions)}
-        strat_dict.update({file.name: str(file) for file in strat_bed_files})
-        batch_beds = batch.read_input_group(**strat_dict)
+        batch_beds = batch.read_input_group(
+            **get_stratification_files(stratification),
+        )
         command += f'--stratification {batch_beds["definition.tsv"]}'
 
     job.command(command)
@@ -304,12 +351,7 @@ def post_results_job(
 
     post_job = get_batch().new_job(name=f'Update metamist for {sample_id}')
 
-    prepare_git_job(
-        job=post_job,
-        organisation=get_organisation_name_from_current_directory(),
-        repo_name=get_repo_name_from_current_directory(),
-        commit=get_git_commit_ref_of_current_repository(),
-    )
+    prepare_git_job(job=post_job, **get_git_details())
     post_job.image(get_config()['workflow']['driver_image'])
     copy_common_env(post_job)
     authenticate_cloud_credentials_in_job(post_job)
@@ -361,7 +403,7 @@ def main(input_file: str, stratification: str | None, dry_run: bool = False):
     # generate single sample vcfs
     sample_jobs = mt_to_vcf(
         input_mt=input_file,
-        samples=set(validation_lookup.keys()),
+        samples=set(validation_lookup),
         output_root=validation_output_path,
     )
 